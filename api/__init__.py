@@ -1,4 +1,5 @@
 from .base import BaseAPI, BaseCommandProcessor, BaseQueryProcessor
+from .pagination import KeysetCursorPagination
 from .views import (
     CreateAPI,
     DestroyAPIMixin,
@@ -22,4 +23,5 @@ __all__ = [
     RetrieveUpdateDestroyAPI,
     BaseCommandProcessor,
     BaseQueryProcessor,
+    KeysetCursorPagination,
 ]
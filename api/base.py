@@ -1,17 +1,94 @@
 import abc
+import operator
+import threading
+from collections import OrderedDict
 from typing import Callable, List, Type, Union
 
+from asgiref.sync import sync_to_async
+
 from django.contrib.auth import get_user_model
+from django.core import exceptions
 from django.db import models
+from django.http import HttpResponse
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
+from rest_framework.pagination import PageNumberPagination
+
+from .pagination import KeysetCursorPagination, countless_variant
 from .serializers import BaseSerializer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pydantic
+except ImportError:
+    pydantic = None
+
+# TypeAdapters built for `BaseAPI.request_model`, keyed by model class.
+_request_adapters = {}
+
+# Shared paginator instances for views with `pagination_stateless = True`,
+# keyed by pagination class.
+_stateless_paginators = {}
+
+# Bounded LRU of query results used by `BaseQueryProcessor.cached_queryset`,
+# keyed by (sql, params, user pk, model version). Commands bump the model
+# version (see `BaseCommandProcessor.invalidate_cached_queries`) so stale
+# entries are never served after a write.
+QUERY_CACHE_MAX_SIZE = 512
+_query_cache = OrderedDict()
+_query_cache_lock = threading.Lock()
+_query_cache_versions = {}
+
 USER_MODEL = get_user_model()
 
+# Cache of `(serializer_class, model)` -> (select_related, prefetch_related)
+# computed by `_related_field_hints()`.
+_related_hints_cache = {}
+
+
+def _related_field_hints(serializer_class, model) -> tuple:
+    """
+    Classify the relations named by the serializer's declared fields into
+    `select_related` / `prefetch_related` field names for `model`.
+    """
+    try:
+        return _related_hints_cache[(serializer_class, model)]
+    except KeyError:
+        pass
+
+    select_related = []
+    prefetch_related = []
+    for field_name, field in serializer_class._declared_fields.items():
+        source = (field.source or field_name).split(".")[0]
+        if source == "*":
+            continue
+
+        try:
+            model_field = model._meta.get_field(source)
+        except exceptions.FieldDoesNotExist:
+            continue
+
+        if not model_field.is_relation:
+            continue
+
+        if model_field.many_to_one or model_field.one_to_one:
+            if source not in select_related:
+                select_related.append(source)
+        elif source not in prefetch_related:
+            prefetch_related.append(source)
+
+    hints = (tuple(select_related), tuple(prefetch_related))
+    _related_hints_cache[(serializer_class, model)] = hints
+    return hints
+
 
 class BaseProcessor(abc.ABC):
     # If you want to use object lookups other than pk, set 'lookup_field'.
@@ -40,22 +117,36 @@ class BaseProcessor(abc.ABC):
         self._paginate_queryset = paginate_queryset
         self._check_object_permissions = check_object_permissions
         self._partial_update = partial_update
+        self._lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        self._lookup_value_getter = operator.itemgetter(self._lookup_url_kwarg)
 
     def check_object_permissions(self, obj: models.Model) -> None:
         self._check_object_permissions(obj)
 
-    def get_object(self, queryset: models.QuerySet) -> models.Model:
-        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
-
-        assert lookup_url_kwarg in self._url_params, (
-            "Expected view %s to be called with a URL keyword argument "
-            'named "%s". Fix your URL conf, or set the `.lookup_field` '
-            "attribute on the view correctly."
-            % (self.__class__.__name__, lookup_url_kwarg)
-        )
+    def check_object_permissions_bulk(self, objs: List[models.Model]) -> None:
+        """
+        Check object permissions for a whole page of objects at once.
+        The default loops per object; override it to collapse the page
+        into a single query (e.g. filter allowed pks with `pk__in` and
+        reject the difference). Query processors apply an overridden
+        implementation to every page they paginate — the default is not
+        applied, so list endpoints keep their existing behavior.
+        """
+        for obj in objs:
+            self._check_object_permissions(obj)
 
-        filter_kwargs = {self.lookup_field: self._url_params[lookup_url_kwarg]}
-        obj = get_object_or_404(queryset, **filter_kwargs)
+    def get_object(self, queryset: models.QuerySet) -> models.Model:
+        try:
+            lookup_value = self._lookup_value_getter(self._url_params)
+        except KeyError:
+            raise exceptions.ImproperlyConfigured(
+                "Expected view %s to be called with a URL keyword argument "
+                'named "%s". Fix your URL conf, or set the `.lookup_field` '
+                "attribute on the view correctly."
+                % (self.__class__.__name__, self._lookup_url_kwarg)
+            )
+
+        obj = get_object_or_404(queryset, **{self.lookup_field: lookup_value})
 
         self.check_object_permissions(obj)
 
@@ -63,19 +154,74 @@ class BaseProcessor(abc.ABC):
 
 
 class BaseCommandProcessor(BaseProcessor):
+    # Model the command writes to; used to expire `cached_queryset` entries
+    model = None
+
     def execute(self) -> Union[models.Model, dict]:
         """Execute command"""
         raise NotImplementedError()
 
+    def invalidate_cached_queries(self) -> None:
+        """
+        Bump the model's version stamp so query results cached via
+        `BaseQueryProcessor.cached_queryset` are no longer served.
+        Called by the write mixins after `execute()`.
+        """
+        if self.model is not None:
+            _query_cache_versions[self.model] = (
+                _query_cache_versions.get(self.model, 0) + 1
+            )
+
+    async def aexecute(self) -> Union[models.Model, dict]:
+        """
+        Async variant of `execute`, for callers running under ASGI.
+        Override it in processors built on the async ORM (`aget`,
+        `acreate`, ...); the default runs `execute` in a worker thread so
+        the event loop is never blocked by the DB round trip.
+        """
+        return await sync_to_async(self.execute)()
+
 
 class BaseQueryProcessor(BaseProcessor):
     model = None  # Required for filters
     paginated = True
 
+    # Relations attached by the processor before filtering, on top of the
+    # serializer-derived hints from the view. Entries in
+    # `prefetch_related_fields` may be `Prefetch` objects — e.g.
+    # `Prefetch("author", queryset=Author.objects.only("id", "name"))` —
+    # which keeps the second query narrow and beats select_related for
+    # low-cardinality FKs repeated across many rows, since the FK row is
+    # fetched once instead of duplicated into every result row.
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    # Opt-in result cache for `cached_queryset()`: identical queries from
+    # the same user are answered from memory until a command writes to
+    # the model.
+    cache_queries = False
+
+    # Whether paginated responses need the total row count. Off by default:
+    # page-number paginators are swapped for a countless variant that
+    # detects "has next page" from one extra fetched row instead of
+    # running COUNT(*) on every request.
+    include_count = False
+
     def execute(self) -> Union[models.Model, List[models.Model], dict, List[dict]]:
         """Execute query"""
         raise NotImplementedError()
 
+    async def aexecute(
+        self,
+    ) -> Union[models.Model, List[models.Model], dict, List[dict]]:
+        """
+        Async variant of `execute`, for callers running under ASGI.
+        Override it in processors built on the async ORM; the default
+        runs `execute` in a worker thread so the event loop is never
+        blocked by the DB round trip.
+        """
+        return await sync_to_async(self.execute)()
+
     def filter_and_paginate_queryset(
         self, queryset: models.QuerySet
     ) -> List[models.Model]:
@@ -84,11 +230,65 @@ class BaseQueryProcessor(BaseProcessor):
 
     def paginate_queryset(self, queryset: models.QuerySet) -> List[models.Model]:
         """Paginate queryset"""
-        return self._paginate_queryset(queryset)
+        page = self._paginate_queryset(queryset)
+        if (
+            page is not None
+            and type(self).check_object_permissions_bulk
+            is not BaseProcessor.check_object_permissions_bulk
+        ):
+            self.check_object_permissions_bulk(page)
+        return page
 
     def filter_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
         """Filter queryset"""
-        return self._filter_queryset(queryset)
+        return self._filter_queryset(self.optimize_queryset(queryset))
+
+    def optimize_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Apply the processor's related-field hints to `queryset`."""
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+        return queryset
+
+    def cached_queryset(self, queryset: models.QuerySet) -> List[models.Model]:
+        """
+        Evaluate `queryset`, reusing results cached for an identical query
+        from the same user. Requires `cache_queries = True`; entries expire
+        as soon as a command declares a write against the model.
+        """
+        if not self.cache_queries:
+            return list(queryset)
+
+        try:
+            sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+        except exceptions.EmptyResultSet:
+            # Django proved the query matches nothing (e.g. `pk__in=[]`),
+            # so there is no SQL to key on and nothing worth caching.
+            return []
+        key = (
+            sql,
+            params,
+            getattr(self._current_user, "pk", None),
+            _query_cache_versions.get(queryset.model, 0),
+        )
+
+        try:
+            with _query_cache_lock:
+                if key in _query_cache:
+                    _query_cache.move_to_end(key)
+                    return list(_query_cache[key])
+        except TypeError:
+            # Unhashable query params; skip the cache for this query.
+            return list(queryset)
+
+        results = list(queryset)
+        with _query_cache_lock:
+            _query_cache[key] = results
+            _query_cache.move_to_end(key)
+            while len(_query_cache) > QUERY_CACHE_MAX_SIZE:
+                _query_cache.popitem(last=False)
+        return list(results)
 
 
 class BaseAPI(APIView):
@@ -98,11 +298,67 @@ class BaseAPI(APIView):
     queryset_class = None
     serializer_class = None
 
-    # The filter backend classes to use for queryset filtering
+    # Opt-in fast path that renders response data straight to JSON bytes
+    # with orjson, skipping DRF content negotiation and renderer
+    # selection. Falls back to a regular DRF `Response` when orjson is
+    # not installed.
+    fast_json = False
+
+    # Optional Pydantic model for write payloads. When set, the raw
+    # request body is parsed and validated against it in a single
+    # C-level pass, bypassing the request serializer (and DRF's separate
+    # parse-then-validate walk) entirely. Requires pydantic v2.
+    request_model = None
+
+    # Optional slimmer serializer used only for serializing command output.
+    # When left as `None`, write actions reuse the request serializer
+    # instance instead of building a second one.
+    response_serializer_class = None
+
+    # Related-field names attached to querysets before filtering, to avoid
+    # N+1 queries during serialization. Leave as `None` to derive them from
+    # the serializer's declared fields; set to an empty tuple to disable.
+    select_related_fields = None
+    prefetch_related_fields = None
+
+    # The filter backend classes to use for queryset filtering. Backends
+    # are stateless, so they are instantiated once per view class (see
+    # `__init_subclass__`) rather than once per request.
     filter_backends = api_settings.DEFAULT_FILTER_BACKENDS
+    _filter_backend_instances = tuple(backend() for backend in filter_backends)
 
     # The style to use for queryset pagination.
-    pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
+    pagination_class = KeysetCursorPagination
+
+    # Set to True to fetch the next page on a background thread while the
+    # current page is being serialized, hiding the DB round trip behind
+    # user think-time. Only honored by the countless page-number
+    # paginator; prefetched pages can be one write behind, so reserve
+    # this for read-mostly endpoints.
+    prefetch_next_page = False
+
+    # Set to True to share one paginator instance across all requests to
+    # the view class instead of allocating one per request. Only safe for
+    # paginators that keep no per-request state — DRF's built-ins store
+    # the current page/request on `self`, so leave this off for them.
+    pagination_stateless = False
+
+    # Resolved once per class in `__init_subclass__` so the hot-path
+    # `get_*_class()` calls are a single attribute read per request.
+    _resolved_command_class = None
+    _resolved_queryset_class = None
+    _resolved_serializer_class = None
+    _resolved_response_serializer_class = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._resolved_command_class = cls.command_class
+        cls._resolved_queryset_class = cls.queryset_class
+        cls._resolved_serializer_class = cls.serializer_class
+        cls._resolved_response_serializer_class = cls.response_serializer_class
+        cls._filter_backend_instances = tuple(
+            backend() for backend in cls.filter_backends
+        )
 
     def get_processor_init(self) -> dict:
         """Processor init params"""
@@ -116,12 +372,12 @@ class BaseAPI(APIView):
         }
 
     def get_queryset_class(self) -> Type[BaseQueryProcessor]:
-        assert self.queryset_class is not None, (
+        assert self._resolved_queryset_class is not None, (
             "'%s' should either include a `queryset_class` attribute, "
             "or override the `get_queryest_class()` method." % self.__class__.__name__
         )
 
-        return self.queryset_class
+        return self._resolved_queryset_class
 
     def get_queryset(self, *args, **kwargs) -> BaseQueryProcessor:
         if getattr(self, "swagger_fake_view", False):
@@ -131,15 +387,16 @@ class BaseAPI(APIView):
         queryset_class = self.get_queryset_class()
         default_kwargs = self.get_processor_init()
         default_kwargs.update(kwargs)
-        return queryset_class(*args, **default_kwargs)
+        self._queryset_processor = queryset_class(*args, **default_kwargs)
+        return self._queryset_processor
 
     def get_command_class(self) -> Type[BaseCommandProcessor]:
-        assert self.command_class is not None, (
+        assert self._resolved_command_class is not None, (
             "'%s' should either include a `command_class` attribute, "
             "or override the `get_command_class()` method." % self.__class__.__name__
         )
 
-        return self.command_class
+        return self._resolved_command_class
 
     def get_command(self, *args, **kwargs) -> BaseCommandProcessor:
         command_class = self.get_command_class()
@@ -164,18 +421,97 @@ class BaseAPI(APIView):
         serializations depending on the incoming request.
         (Eg. admins get full serialization, others get basic serialization)
         """
-        assert self.serializer_class is not None, (
+        assert self._resolved_serializer_class is not None, (
             "'%s' should either include a `serializer_class` attribute, "
             "or override the `get_serializer_class()` method." % self.__class__.__name__
         )
 
-        return self.serializer_class
+        return self._resolved_serializer_class
+
+    def get_response_serializer(self, *args, **kwargs) -> BaseSerializer:
+        """
+        Return the serializer instance that should be used for serializing
+        command output. Defaults to `get_serializer_class()` when no
+        `response_serializer_class` is set.
+        """
+        serializer_class = (
+            self._resolved_response_serializer_class or self.get_serializer_class()
+        )
+        kwargs.setdefault("context", self.get_serializer_context())
+        return serializer_class(*args, **kwargs)
+
+    def validate_request_data(self, request, partial: bool = False) -> tuple:
+        """
+        Validate the incoming write payload. Returns
+        `(request_serializer, validated_data)`; the serializer slot is
+        `None` on the `request_model` fast path, which parses and
+        validates the raw body in one step.
+        """
+        if self.request_model is not None:
+            return None, self.validate_request_body(request, partial=partial)
+
+        serializer = self.get_serializer(data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        return serializer, serializer.validated_data
+
+    def validate_request_body(self, request, partial: bool = False) -> dict:
+        """Parse and validate `request.body` against `request_model`."""
+        assert pydantic is not None, (
+            "'%s' sets `request_model` but pydantic is not installed."
+            % self.__class__.__name__
+        )
+
+        try:
+            adapter = _request_adapters[self.request_model]
+        except KeyError:
+            adapter = _request_adapters.setdefault(
+                self.request_model, pydantic.TypeAdapter(self.request_model)
+            )
+
+        try:
+            model = adapter.validate_json(request.body)
+        except pydantic.ValidationError as exc:
+            detail = {}
+            for error in exc.errors():
+                field = ".".join(str(part) for part in error["loc"])
+                field = field or api_settings.NON_FIELD_ERRORS_KEY
+                detail.setdefault(field, []).append(error["msg"])
+            raise ValidationError(detail)
+
+        return model.model_dump(exclude_unset=partial)
+
+    def serialize_command_response(
+        self, request_serializer: BaseSerializer, command_response
+    ) -> dict:
+        """
+        Serialize command output for the response body.
+
+        When no `response_serializer_class` is configured, the validated
+        request serializer (if the action built one) is reused by
+        pointing it at the command output, so write actions build the
+        serializer field tree only once.
+        """
+        if (
+            request_serializer is not None
+            and self._resolved_response_serializer_class is None
+        ):
+            request_serializer.instance = command_response
+            return request_serializer.data
+        return self.get_response_serializer(command_response).data
 
     def get_serializer_context(self) -> dict:
         """
-        Extra context provided to the serializer class.
+        Extra context provided to the serializer class. Built once per
+        request (the view instance is per-request) and reused across
+        every serializer constructed while handling it.
         """
-        return {"request": self.request, "format": self.format_kwarg, "view": self}
+        if not hasattr(self, "_serializer_context"):
+            self._serializer_context = {
+                "request": self.request,
+                "format": self.format_kwarg,
+                "view": self,
+            }
+        return self._serializer_context
 
     def filter_queryset(self, queryset) -> models.QuerySet:
         """
@@ -185,8 +521,50 @@ class BaseAPI(APIView):
         method if you want to apply the configured filtering backend to the
         default queryset.
         """
-        for backend in list(self.filter_backends):
-            queryset = backend().filter_queryset(self.request, queryset, self)
+        if isinstance(queryset, models.QuerySet):
+            queryset = self.optimize_queryset(queryset)
+        for backend in self._filter_backend_instances:
+            queryset = backend.filter_queryset(self.request, queryset, self)
+        return queryset
+
+    def optimize_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        """
+        Attach `select_related`/`prefetch_related` for the relations the
+        serializer is going to touch, so serialization doesn't trigger one
+        extra query per row.
+        """
+        select_related = self.select_related_fields
+        prefetch_related = self.prefetch_related_fields
+
+        if select_related is None or prefetch_related is None:
+            serializer_class = self._resolved_serializer_class
+            if serializer_class is None:
+                derived = ((), ())
+            else:
+                derived = _related_field_hints(serializer_class, queryset.model)
+            # Each side is configured independently: only the ones left
+            # as `None` fall back to the serializer-derived hints.
+            if select_related is None:
+                select_related = derived[0]
+            if prefetch_related is None:
+                prefetch_related = derived[1]
+
+        # Skip relations the processor already attached (possibly as a
+        # narrowed `Prefetch`), so the two sets of hints never conflict.
+        covered = {
+            lookup.prefetch_to if isinstance(lookup, models.Prefetch) else lookup
+            for lookup in queryset._prefetch_related_lookups
+        }
+        if isinstance(queryset.query.select_related, dict):
+            covered.update(queryset.query.select_related)
+        if covered:
+            select_related = [f for f in select_related if f not in covered]
+            prefetch_related = [f for f in prefetch_related if f not in covered]
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
         return queryset
 
     @property
@@ -197,10 +575,34 @@ class BaseAPI(APIView):
         if not hasattr(self, "_paginator"):
             if self.pagination_class is None:
                 self._paginator = None
+            elif self.pagination_stateless:
+                pagination_class = self.get_pagination_class()
+                try:
+                    self._paginator = _stateless_paginators[pagination_class]
+                except KeyError:
+                    self._paginator = _stateless_paginators.setdefault(
+                        pagination_class, pagination_class()
+                    )
             else:
-                self._paginator = self.pagination_class()
+                self._paginator = self.get_pagination_class()()
         return self._paginator
 
+    def get_pagination_class(self):
+        """
+        Return the pagination class to use, swapping page-number
+        paginators for their countless variant unless the query processor
+        asks for the total count.
+        """
+        pagination_class = self.pagination_class
+        processor = getattr(self, "_queryset_processor", None)
+        if (
+            processor is not None
+            and not processor.include_count
+            and issubclass(pagination_class, PageNumberPagination)
+        ):
+            return countless_variant(pagination_class)
+        return pagination_class
+
     def paginate_queryset(self, queryset) -> List[dict]:
         """
         Return a single page of results, or `None` if pagination is disabled.
@@ -216,6 +618,25 @@ class BaseAPI(APIView):
         assert self.paginator is not None
         return self.paginator.get_paginated_response(data)
 
+    def render_response(self, data, status: int = None, headers: dict = None):
+        """
+        Build the HTTP response for the given output data.
+
+        With `fast_json` enabled (and orjson installed) the data is
+        encoded to JSON bytes directly, skipping DRF's content
+        negotiation and renderer machinery.
+        """
+        if self.fast_json and orjson is not None:
+            response = HttpResponse(
+                orjson.dumps(data),
+                content_type="application/json",
+                status=status,
+            )
+            for name, value in (headers or {}).items():
+                response[name] = value
+            return response
+        return Response(data, status=status, headers=headers)
+
     def check_instance_permissions(self, instance):
         return super().check_object_permissions(self.request, instance)
 
@@ -8,16 +8,13 @@ from .base import BaseCommandProcessor, BaseQueryProcessor
 class CreateAPIMixin:
     def create(self, request, *args, **kwargs) -> dict:
         """Action for POST method"""
-        request_serializer = self.get_serializer(data=request.data)
-        request_serializer.is_valid(raise_exception=True)
+        request_serializer, validated_data = self.validate_request_data(request)
 
-        command: BaseCommandProcessor = self.get_command(
-            request_data=request_serializer.validated_data
-        )
+        command: BaseCommandProcessor = self.get_command(request_data=validated_data)
         command_response = command.execute()
-        response_serializer = self.get_serializer(command_response)
+        command.invalidate_cached_queries()
 
-        return response_serializer.data
+        return self.serialize_command_response(request_serializer, command_response)
 
     def get_success_headers(self, data):
         try:
@@ -50,16 +47,17 @@ class UpdateAPIMixin:
     def update(self, request, *args, **kwargs) -> dict:
         """Action for PUT method"""
         partial = kwargs.pop("partial", False)
-        request_serializer = self.get_serializer(data=request.data, partial=partial)
-        request_serializer.is_valid(raise_exception=True)
+        request_serializer, validated_data = self.validate_request_data(
+            request, partial=partial
+        )
 
         command: BaseCommandProcessor = self.get_command(
-            request_data=request_serializer.validated_data, partial_update=partial
+            request_data=validated_data, partial_update=partial
         )
         command_response = command.execute()
-        response_serializer = self.get_serializer(command_response)
+        command.invalidate_cached_queries()
 
-        return response_serializer.data
+        return self.serialize_command_response(request_serializer, command_response)
 
     def partial_update(self, request, *args, **kwargs):
         """Action for PATCH method"""
@@ -72,3 +70,4 @@ class DestroyAPIMixin:
         """Action for DELETE method"""
         command = self.get_command()
         command.execute()
+        command.invalidate_cached_queries()
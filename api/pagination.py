@@ -0,0 +1,148 @@
+import threading
+from collections import OrderedDict
+
+from django.db import connections
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# Cache of pagination classes generated by `countless_variant()`.
+_countless_variants = {}
+
+# Pages fetched ahead of time for views with `prefetch_next_page = True`,
+# keyed by (query, offset, page size, user pk). Entries are consumed on
+# hit and the table is bounded, so it never grows past a few pages.
+PREFETCHED_PAGES_MAX_SIZE = 128
+_prefetched_pages = OrderedDict()
+_prefetched_pages_lock = threading.Lock()
+
+
+def _prefetch_page(queryset, key, offset, limit) -> None:
+    """Evaluate one page slice on a worker thread and stash the rows."""
+    try:
+        results = list(queryset[offset : offset + limit])
+        with _prefetched_pages_lock:
+            _prefetched_pages[key] = results
+            _prefetched_pages.move_to_end(key)
+            while len(_prefetched_pages) > PREFETCHED_PAGES_MAX_SIZE:
+                _prefetched_pages.popitem(last=False)
+    finally:
+        # The thread gets its own DB connections; don't leak them.
+        connections.close_all()
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset ("seek") pagination, used as the project default.
+
+    The position of the last-seen row is encoded as an opaque base64
+    cursor in the `next`/`previous` links and turned into a
+    `WHERE (ordering, pk) > (...)` filter, so fetching page N costs
+    O(page size) instead of the O(N * page size) of LIMIT/OFFSET, and no
+    COUNT(*) query is ever issued.
+    """
+
+    ordering = "-pk"
+
+
+class CountlessPageNumberPagination(PageNumberPagination):
+    """
+    Page-number pagination that never issues the COUNT(*) query.
+
+    Fetches `page_size + 1` rows and derives "has next page" from the
+    overflow row, so responses carry `next`/`previous` links but no
+    `count` — a full table scan saved on every list request.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+            if page_number < 1:
+                raise ValueError("pages start at 1")
+        except (TypeError, ValueError) as exc:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=request.query_params.get(self.page_query_param),
+                    message=exc,
+                )
+            )
+
+        offset = (page_number - 1) * page_size
+        user = getattr(request, "user", None)
+        user_pk = getattr(user, "pk", None)
+        key = (str(queryset.query), offset, page_size, user_pk)
+
+        with _prefetched_pages_lock:
+            results = _prefetched_pages.pop(key, None)
+        if results is None:
+            results = list(queryset[offset : offset + page_size + 1])
+
+        self.request = request
+        self.page_number = page_number
+        self.has_next = len(results) > page_size
+
+        if self.has_next and getattr(view, "prefetch_next_page", False):
+            next_key = (key[0], offset + page_size, page_size, user_pk)
+            self._prefetch_thread = threading.Thread(
+                target=_prefetch_page,
+                args=(queryset, next_key, offset + page_size, page_size + 1),
+                daemon=True,
+            )
+            self._prefetch_thread.start()
+
+        return results[:page_size]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"].pop("count", None)
+        return schema
+
+
+def countless_variant(pagination_class):
+    """
+    Return `pagination_class` with the COUNT(*)-free behavior mixed in,
+    preserving its page size and query param configuration.
+    """
+    if issubclass(pagination_class, CountlessPageNumberPagination):
+        return pagination_class
+
+    try:
+        return _countless_variants[pagination_class]
+    except KeyError:
+        variant = type(
+            "Countless%s" % pagination_class.__name__,
+            (CountlessPageNumberPagination, pagination_class),
+            {},
+        )
+        _countless_variants[pagination_class] = variant
+        return variant
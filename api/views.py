@@ -1,5 +1,5 @@
+from django.http import HttpResponse
 from rest_framework import status
-from rest_framework.response import Response
 
 from .base import BaseAPI
 from .mixins import (
@@ -11,99 +11,170 @@ from .mixins import (
 )
 
 
-class CreateAPI(CreateAPIMixin, BaseAPI):
-    def post(self, request, *args, **kwargs):
-        response_data = self.create(request, *args, **kwargs)
-        headers = self.get_success_headers(response_data)
-        return Response(response_data, status=status.HTTP_201_CREATED, headers=headers)
-
+def _no_content_response() -> HttpResponse:
+    """
+    Plain 204 response. There is no body to render, so skip DRF's
+    content negotiation and renderer selection entirely. Built fresh per
+    call because middleware may mutate response headers.
+    """
+    return HttpResponse(status=status.HTTP_204_NO_CONTENT)
 
-class ListAPI(ListAPIMixin, BaseAPI):
-    def get(self, request, *args, **kwargs):
-        response_data, is_paginated = self.list(request, *args, **kwargs)
 
-        if is_paginated:
-            return self.get_paginated_response(response_data)
+# Handler factories used by `FlattenedAPIMeta`. Each bakes the resolved
+# action and response helpers into closure cells, so a request pays no
+# attribute lookups on the dispatch path itself.
 
-        return Response(response_data)
 
+def _make_post(create, get_success_headers, render_response):
+    def post(self, request, *args, **kwargs):
+        response_data = create(self, request, *args, **kwargs)
+        headers = get_success_headers(self, response_data)
+        return render_response(
+            self, response_data, status=status.HTTP_201_CREATED, headers=headers
+        )
 
-class RetrieveAPI(RetrieveAPIMixin, BaseAPI):
-    def get(self, request, *args, **kwargs):
-        response_data = self.retrieve(request, *args, **kwargs)
-        return Response(response_data)
+    return post
 
 
-class DestroyAPI(DestroyAPIMixin, BaseAPI):
-    def delete(self, request, *args, **kwargs):
-        self.destroy(request, *args, **kwargs)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+def _make_list_get(list_action, get_paginated_response, render_response):
+    def get(self, request, *args, **kwargs):
+        response_data, is_paginated = list_action(self, request, *args, **kwargs)
 
+        if is_paginated:
+            return get_paginated_response(self, response_data)
 
-class UpdateAPI(UpdateAPIMixin, BaseAPI):
-    def put(self, request, *args, **kwargs):
-        response_data = self.update(request, *args, **kwargs)
-        return Response(response_data)
+        return render_response(self, response_data)
 
-    def patch(self, request, *args, **kwargs):
-        response_data = self.partial_update(request, *args, **kwargs)
-        return Response(response_data)
+    return get
 
 
-class ListCreateAPI(ListAPIMixin, CreateAPIMixin, BaseAPI):
+def _make_retrieve_get(retrieve, render_response):
     def get(self, request, *args, **kwargs):
-        response_data, is_paginated = self.list(request, *args, **kwargs)
+        return render_response(self, retrieve(self, request, *args, **kwargs))
 
-        if is_paginated:
-            return self.get_paginated_response(response_data)
+    return get
 
-        return Response(response_data)
-
-    def post(self, request, *args, **kwargs):
-        response_data = self.create(request, *args, **kwargs)
-        headers = self.get_success_headers(response_data)
-        return Response(response_data, status=status.HTTP_201_CREATED, headers=headers)
 
+def _make_put(update, render_response):
+    def put(self, request, *args, **kwargs):
+        return render_response(self, update(self, request, *args, **kwargs))
 
-class RetrieveUpdateAPI(RetrieveAPIMixin, UpdateAPIMixin, BaseAPI):
-    def get(self, request, *args, **kwargs):
-        response_data = self.retrieve(request, *args, **kwargs)
-        return Response(response_data)
+    return put
 
-    def put(self, request, *args, **kwargs):
-        response_data = self.update(request, *args, **kwargs)
-        return Response(response_data)
 
+def _make_patch(partial_update, render_response):
     def patch(self, request, *args, **kwargs):
-        response_data = self.partial_update(request, *args, **kwargs)
-        return Response(response_data)
+        return render_response(self, partial_update(self, request, *args, **kwargs))
 
+    return patch
 
-class RetrieveDestroyAPI(RetrieveAPIMixin, DestroyAPIMixin, BaseAPI):
-    def get(self, request, *args, **kwargs):
-        response_data = self.retrieve(request, *args, **kwargs)
-        return Response(response_data)
 
+def _make_delete(destroy):
     def delete(self, request, *args, **kwargs):
-        self.destroy(request, *args, **kwargs)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        destroy(self, request, *args, **kwargs)
+        return _no_content_response()
+
+    return delete
+
+
+class FlattenedAPIMeta(type):
+    """
+    Specialize each view class at creation time. Action methods resolved
+    through the MRO are copied into the class's own namespace, and the
+    HTTP handlers (`get`/`post`/`put`/`patch`/`delete`) are generated
+    with the resolved action and response helpers bound into closure
+    cells — so dispatching a request walks no mixin chain and repeats no
+    attribute lookups. Methods written in a class body always win over
+    generated ones, and subclasses regenerate their handlers against
+    their own overrides. `__slots__` is deliberately not used: APIView
+    assigns per-request attributes (request, args, headers, ...) and
+    needs the instance `__dict__`.
+    """
+
+    flattened_methods = (
+        "create",
+        "list",
+        "retrieve",
+        "update",
+        "partial_update",
+        "destroy",
+        "get_success_headers",
+    )
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        for method_name in mcs.flattened_methods:
+            if method_name in namespace:
+                continue
+            method = getattr(cls, method_name, None)
+            if method is not None:
+                setattr(cls, method_name, method)
+        mcs._generate_handlers(cls, namespace)
+        return cls
+
+    @classmethod
+    def _generate_handlers(mcs, cls, namespace):
+        render_response = cls.render_response
+
+        if "get" not in namespace:
+            if getattr(cls, "list", None) is not None:
+                cls.get = _make_list_get(
+                    cls.list, cls.get_paginated_response, render_response
+                )
+            elif getattr(cls, "retrieve", None) is not None:
+                cls.get = _make_retrieve_get(cls.retrieve, render_response)
+        if "post" not in namespace and getattr(cls, "create", None) is not None:
+            cls.post = _make_post(cls.create, cls.get_success_headers, render_response)
+        if "put" not in namespace and getattr(cls, "update", None) is not None:
+            cls.put = _make_put(cls.update, render_response)
+        partial_update = getattr(cls, "partial_update", None)
+        if "patch" not in namespace and partial_update is not None:
+            cls.patch = _make_patch(partial_update, render_response)
+        if "delete" not in namespace and getattr(cls, "destroy", None) is not None:
+            cls.delete = _make_delete(cls.destroy)
+
+
+class CreateAPI(CreateAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta):
+    """API with a generated POST handler"""
+
+
+class ListAPI(ListAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta):
+    """API with a generated GET (list) handler"""
+
+
+class RetrieveAPI(RetrieveAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta):
+    """API with a generated GET (retrieve) handler"""
+
+
+class DestroyAPI(DestroyAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta):
+    """API with a generated DELETE handler"""
+
+
+class UpdateAPI(UpdateAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta):
+    """API with generated PUT/PATCH handlers"""
+
+
+class ListCreateAPI(ListAPIMixin, CreateAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta):
+    """API with generated GET (list) and POST handlers"""
+
+
+class RetrieveUpdateAPI(
+    RetrieveAPIMixin, UpdateAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta
+):
+    """API with generated GET (retrieve) and PUT/PATCH handlers"""
 
 
-class RetrieveUpdateDestroyAPI(
-    RetrieveAPIMixin, UpdateAPIMixin, DestroyAPIMixin, BaseAPI
+class RetrieveDestroyAPI(
+    RetrieveAPIMixin, DestroyAPIMixin, BaseAPI, metaclass=FlattenedAPIMeta
 ):
-    def get(self, request, *args, **kwargs):
-        response_data = self.retrieve(request, *args, **kwargs)
-        return Response(response_data)
+    """API with generated GET (retrieve) and DELETE handlers"""
 
-    def put(self, request, *args, **kwargs):
-        response_data = self.update(request, *args, **kwargs)
-        return Response(response_data)
 
-    def patch(self, request, *args, **kwargs):
-        response_data = self.partial_update(request, *args, **kwargs)
-        return Response(response_data)
-
-    def delete(self, request, *args, **kwargs):
-        self.destroy(request, *args, **kwargs)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+class RetrieveUpdateDestroyAPI(
+    RetrieveAPIMixin,
+    UpdateAPIMixin,
+    DestroyAPIMixin,
+    BaseAPI,
+    metaclass=FlattenedAPIMeta,
+):
+    """API with generated GET (retrieve), PUT/PATCH and DELETE handlers"""
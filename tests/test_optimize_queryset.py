@@ -0,0 +1,111 @@
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DEBUG=True,
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "rest_framework",
+        ],
+        USE_TZ=True,
+        ALLOWED_HOSTS=["*"],
+    )
+    django.setup()
+
+from django.db import connection, models  # noqa: E402
+from django.db.models import Prefetch  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from rest_framework import serializers  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from api import BaseQueryProcessor  # noqa: E402
+from api.serializers import BaseSerializer  # noqa: E402
+from api.views import ListAPI  # noqa: E402
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class Book(models.Model):
+    title = models.CharField(max_length=50)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+def setup_module(module):
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(Author)
+        schema_editor.create_model(Book)
+    author = Author.objects.create(name="a")
+    Book.objects.create(title="b", author=author)
+
+
+class AuthorSerializer(BaseSerializer):
+    name = serializers.CharField()
+
+
+class BookSerializer(BaseSerializer):
+    title = serializers.CharField()
+    author = AuthorSerializer()
+
+
+class BookQueryProcessor(BaseQueryProcessor):
+    model = Book
+    paginated = False
+    prefetch_related_fields = (
+        Prefetch("author", queryset=Author.objects.only("id", "name")),
+    )
+
+    def execute(self):
+        return self.filter_queryset(Book.objects.all())
+
+
+class OneSidedBookListAPI(ListAPI):
+    serializer_class = BookSerializer
+    queryset_class = BookQueryProcessor
+    # Only one side disabled; the other stays serializer-derived.
+    select_related_fields = ()
+    pagination_class = None
+    permission_classes = ()
+    authentication_classes = ()
+
+
+class DerivedSelectBookListAPI(OneSidedBookListAPI):
+    select_related_fields = None
+    prefetch_related_fields = ()
+    queryset_class = type(
+        "PlainBookQueryProcessor",
+        (BookQueryProcessor,),
+        {"prefetch_related_fields": ()},
+    )
+
+
+def test_one_sided_view_hints_with_processor_prefetch():
+    response = OneSidedBookListAPI.as_view()(APIRequestFactory().get("/books/"))
+
+    assert response.status_code == 200
+    assert [dict(row) for row in response.data] == [
+        {"title": "b", "author": {"name": "a"}}
+    ]
+
+
+def test_one_sided_view_hints_still_derive_the_open_side():
+    with CaptureQueriesContext(connection) as context:
+        view = DerivedSelectBookListAPI.as_view()
+        response = view(APIRequestFactory().get("/books/"))
+
+    assert response.status_code == 200
+    # Derived select_related joins the author in, so one query total.
+    assert len(context.captured_queries) == 1
+    assert "JOIN" in context.captured_queries[0]["sql"]